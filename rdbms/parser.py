@@ -1,16 +1,51 @@
+import functools
 import re
+import sys
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 
 
-@dataclass
+# Precompiled patterns for each statement shape. Compiling once at module
+# load keeps the per-parse cost to a plain .match() call on the hot path.
+_RE_CREATE_TABLE = re.compile(r'CREATE TABLE (\w+) \((.*)\)', re.IGNORECASE)
+_RE_INSERT = re.compile(r'INSERT INTO (\w+) VALUES (.+)', re.IGNORECASE)
+_RE_SELECT = re.compile(r'SELECT (.*?) FROM (\w+)(.*)', re.IGNORECASE)
+_RE_UPDATE = re.compile(r'UPDATE (\w+) SET (.*?)(?:WHERE (.*))?$', re.IGNORECASE)
+_RE_DELETE = re.compile(r'DELETE FROM (\w+)(?:\s+WHERE (.*))?$', re.IGNORECASE)
+# One parenthesized VALUES group in a (possibly multi-row) INSERT. The
+# group body is quoted strings or anything that is not a paren.
+_RE_VALUES_GROUP = re.compile(r"\(((?:'(?:[^'\\]|\\.)*'|[^()])*)\)\s*(?:,\s*|$)")
+
+# Numeric literals. Matching these up front is cheaper than attempting
+# int()/float() conversions and catching the ValueError on every
+# non-numeric token. Floats need a decimal point or an exponent.
+_RE_INT = re.compile(r'[+-]?\d+')
+_RE_FLOAT = re.compile(r'[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?')
+
+# One SET-clause assignment: column = value, where the value is a quoted
+# string (commas inside it included) or a bare token up to the next comma.
+_RE_SET_ITEM = re.compile(r"(\w+)\s*=\s*('[^']*'|[^,]+?)\s*(?:,|$)")
+
+# JOIN keyword detection for routing SELECTs, without uppercasing the
+# whole statement first
+_RE_HAS_JOIN = re.compile(r'\bJOIN\b', re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
 class ParsedCommand:
-    """Represents a parsed SQL command"""
+    """
+    Represents a parsed SQL command.
+
+    Frozen with slots: instances drop the per-object __dict__ and are
+    immutable, which also makes sharing them through the parse cache
+    obviously safe.
+    """
     command_type: str
     table_name: Optional[str] = None
     columns: Optional[List[str]] = None
     types: Optional[List[str]] = None
     values: Optional[List[Any]] = None
+    rows: Optional[List[List[Any]]] = None
     where: Optional[Dict[str, Any]] = None
     set_values: Optional[Dict[str, Any]] = None
     primary_key: Optional[str] = None
@@ -27,6 +62,13 @@ class SQLParser:
     Supports: CREATE TABLE, INSERT, SELECT, UPDATE, DELETE, JOIN, DROP TABLE, CREATE INDEX
     """
 
+    def __init__(self):
+        # Cache parse results per normalized statement. Repeated commands
+        # (the common case for prepared-style workloads) skip the regex
+        # machinery entirely. Callers must not mutate cached commands;
+        # Database copies the values list before handing it to a table.
+        self._parse_cached = functools.lru_cache(maxsize=256)(self._parse_uncached)
+
     def parse(self, sql: str) -> ParsedCommand:
         """
         Parse a SQL command string.
@@ -46,32 +88,34 @@ class SQLParser:
         if not sql:
             raise ValueError("Empty SQL command")
 
-        # Normalize whitespace and make case-insensitive for keywords
-        sql = ' '.join(sql.split())
-        sql_upper = sql.upper()
-
-        # Determine command type and parse accordingly
-        if sql_upper.startswith('CREATE TABLE'):
-            return self._parse_create_table(sql)
-        elif sql_upper.startswith('INSERT INTO'):
-            return self._parse_insert(sql)
-        elif sql_upper.startswith('SELECT'):
-            return self._parse_select(sql)
-        elif sql_upper.startswith('UPDATE'):
-            return self._parse_update(sql)
-        elif sql_upper.startswith('DELETE FROM'):
-            return self._parse_delete(sql)
-        elif sql_upper.startswith('DROP TABLE'):
-            return self._parse_drop_table(sql)
-        elif sql_upper.startswith('CREATE INDEX'):
-            return self._parse_create_index(sql)
-        else:
+        # Normalize whitespace so equivalent statements share a cache slot
+        return self._parse_cached(' '.join(sql.split()))
+
+    def clear_cache(self) -> None:
+        """Drop all cached parse results."""
+        self._parse_cached.cache_clear()
+
+    def _parse_uncached(self, sql: str) -> ParsedCommand:
+        # Dispatch on the leading keyword(s). Only the first one or two
+        # tokens are uppercased, instead of the whole statement, and the
+        # handler is found with a single dict lookup instead of a chain
+        # of startswith checks.
+        head, _, rest = sql.partition(' ')
+        head_upper = head.upper()
+        second_upper = rest.partition(' ')[0].upper()
+
+        handler = (self._DISPATCH.get((head_upper, second_upper))
+                   or self._DISPATCH.get((head_upper, None)))
+
+        if handler is None:
             raise ValueError("Invalid SQL command")
 
+        return handler(self, sql)
+
     def _parse_create_table(self, sql: str) -> ParsedCommand:
         """Parse CREATE TABLE command"""
         # Pattern: CREATE TABLE table_name (col1 TYPE1 [PRIMARY KEY] [UNIQUE], col2 TYPE2, ...)
-        match = re.match(r'CREATE TABLE (\w+) \((.*)\)', sql, re.IGNORECASE)
+        match = _RE_CREATE_TABLE.match(sql)
 
         if not match:
             raise ValueError("Invalid CREATE TABLE syntax")
@@ -93,18 +137,24 @@ class SQLParser:
             if len(parts) < 2:
                 raise ValueError(f"Invalid column definition: {col_def}")
 
-            col_name = parts[0]
+            # Intern column names: every statement that touches the column
+            # repeats the same string, and interned names make those
+            # comparisons pointer checks
+            col_name = sys.intern(parts[0])
             col_type = parts[1].upper()
 
             columns.append(col_name)
             types.append(col_type)
 
+            # Uppercase the definition once for the constraint checks
+            col_def_upper = col_def.upper()
+
             # Check for PRIMARY KEY
-            if 'PRIMARY' in col_def.upper() and 'KEY' in col_def.upper():
+            if 'PRIMARY' in col_def_upper and 'KEY' in col_def_upper:
                 primary_key = col_name
 
             # Check for UNIQUE
-            if 'UNIQUE' in col_def.upper():
+            if 'UNIQUE' in col_def_upper:
                 unique_constraints.append(col_name)
 
         return ParsedCommand(
@@ -117,36 +167,55 @@ class SQLParser:
         )
 
     def _parse_insert(self, sql: str) -> ParsedCommand:
-        """Parse INSERT command"""
-        # Pattern: INSERT INTO table_name VALUES (val1, val2, ...)
-        match = re.match(r'INSERT INTO (\w+) VALUES \((.*)\)', sql, re.IGNORECASE)
+        """Parse INSERT command (single- or multi-row)"""
+        # Pattern: INSERT INTO table_name VALUES (v1, ...) [, (v1, ...) ...]
+        match = _RE_INSERT.match(sql)
 
         if not match:
             raise ValueError("Invalid INSERT syntax")
 
         table_name = match.group(1)
-        values_str = match.group(2)
+        values_part = match.group(2)
+
+        # Collect each parenthesized group, requiring the groups to cover
+        # the whole VALUES section
+        groups = []
+        pos = 0
+
+        for group_match in _RE_VALUES_GROUP.finditer(values_part):
+            if values_part[pos:group_match.start()].strip():
+                raise ValueError("Invalid INSERT syntax")
+            groups.append(self._parse_values(group_match.group(1)))
+            pos = group_match.end()
+
+        if not groups or values_part[pos:].strip():
+            raise ValueError("Invalid INSERT syntax")
 
-        # Parse values
-        values = self._parse_values(values_str)
+        # Single-row inserts keep the original values shape; multi-row
+        # inserts carry the full batch for insert_many
+        if len(groups) == 1:
+            return ParsedCommand(
+                command_type='INSERT',
+                table_name=table_name,
+                values=groups[0]
+            )
 
         return ParsedCommand(
             command_type='INSERT',
             table_name=table_name,
-            values=values
+            rows=groups
         )
 
     def _parse_select(self, sql: str) -> ParsedCommand:
         """Parse SELECT command (including JOIN)"""
-        sql_upper = sql.upper()
-
-        # Check if it's a JOIN
-        if 'JOIN' in sql_upper:
+        # Check if it's a JOIN (case-insensitive search instead of
+        # uppercasing a copy of the whole statement)
+        if _RE_HAS_JOIN.search(sql):
             return self._parse_join(sql)
 
         # Pattern: SELECT columns FROM table [WHERE condition]
         # Extract columns
-        select_match = re.match(r'SELECT (.*?) FROM (\w+)(.*)', sql, re.IGNORECASE)
+        select_match = _RE_SELECT.match(sql)
 
         if not select_match:
             raise ValueError("Invalid SELECT syntax")
@@ -177,7 +246,7 @@ class SQLParser:
     def _parse_update(self, sql: str) -> ParsedCommand:
         """Parse UPDATE command"""
         # Pattern: UPDATE table SET col1=val1, col2=val2 [WHERE condition]
-        match = re.match(r'UPDATE (\w+) SET (.*?)(?:WHERE (.*))?$', sql, re.IGNORECASE)
+        match = _RE_UPDATE.match(sql)
 
         if not match:
             raise ValueError("Invalid UPDATE syntax")
@@ -186,19 +255,21 @@ class SQLParser:
         set_clause = match.group(2).strip()
         where_clause = match.group(3)
 
-        # Parse SET clause
+        # Parse SET clause in a single regex pass, checking that the
+        # matches cover the whole clause (a gap means a malformed
+        # assignment, e.g. a missing '=')
         set_values = {}
-        set_parts = [s.strip() for s in set_clause.split(',')]
-
-        for part in set_parts:
-            if '=' not in part:
-                raise ValueError(f"Invalid SET clause: {part}")
+        pos = 0
 
-            col, val = part.split('=', 1)
-            col = col.strip()
-            val = val.strip()
+        for set_match in _RE_SET_ITEM.finditer(set_clause):
+            if set_clause[pos:set_match.start()].strip():
+                raise ValueError(
+                    f"Invalid SET clause: {set_clause[pos:set_match.start()].strip()}")
+            set_values[set_match.group(1)] = self._parse_value(set_match.group(2))
+            pos = set_match.end()
 
-            set_values[col] = self._parse_value(val)
+        if set_clause[pos:].strip():
+            raise ValueError(f"Invalid SET clause: {set_clause[pos:].strip()}")
 
         # Parse WHERE clause if present
         where = None
@@ -215,7 +286,7 @@ class SQLParser:
     def _parse_delete(self, sql: str) -> ParsedCommand:
         """Parse DELETE command"""
         # Pattern: DELETE FROM table [WHERE condition]
-        match = re.match(r'DELETE FROM (\w+)(?:\s+WHERE (.*))?$', sql, re.IGNORECASE)
+        match = _RE_DELETE.match(sql)
 
         if not match:
             raise ValueError("Invalid DELETE syntax")
@@ -237,20 +308,37 @@ class SQLParser:
     def _parse_join(self, sql: str) -> ParsedCommand:
         """Parse JOIN command"""
         # Pattern: SELECT * FROM table1 [INNER] JOIN table2 ON table1.col1 = table2.col2
-        pattern = r'SELECT \* FROM (\w+) (?:INNER )?JOIN (\w+) ON (\w+)\.(\w+) = (\w+)\.(\w+)'
-        match = re.match(pattern, sql, re.IGNORECASE)
+        # Fixed token shape after whitespace normalization, so walk the
+        # tokens instead of running a backtracking regex
+        tokens = sql.split(' ')
 
-        if not match:
-            raise ValueError("Invalid JOIN syntax")
+        try:
+            if (tokens[0].upper() != 'SELECT' or tokens[1] != '*'
+                    or tokens[2].upper() != 'FROM'):
+                raise ValueError
+
+            left_table = tokens[3]
+
+            pos = 4
+            if tokens[pos].upper() == 'INNER':
+                pos += 1
+
+            if tokens[pos].upper() != 'JOIN':
+                raise ValueError
+            right_table = tokens[pos + 1]
+
+            if tokens[pos + 2].upper() != 'ON' or tokens[pos + 4] != '=':
+                raise ValueError
+
+            # The ON clause: table1.col1 = table2.col2
+            left_table_in_on, _, left_col = tokens[pos + 3].partition('.')
+            right_table_in_on, _, right_col = tokens[pos + 5].partition('.')
 
-        left_table = match.group(1)
-        right_table = match.group(2)
+            if not left_col or not right_col or len(tokens) != pos + 6:
+                raise ValueError
 
-        # The ON clause: table1.col1 = table2.col2
-        left_table_in_on = match.group(3)
-        left_col = match.group(4)
-        right_table_in_on = match.group(5)
-        right_col = match.group(6)
+        except (IndexError, ValueError):
+            raise ValueError("Invalid JOIN syntax")
 
         return ParsedCommand(
             command_type='JOIN',
@@ -262,28 +350,44 @@ class SQLParser:
 
     def _parse_drop_table(self, sql: str) -> ParsedCommand:
         """Parse DROP TABLE command"""
-        match = re.match(r'DROP TABLE (\w+)', sql, re.IGNORECASE)
+        # Pattern: DROP TABLE table_name - simple enough for a plain split
+        parts = sql.split(' ')
 
-        if not match:
+        if len(parts) < 3 or not parts[2]:
             raise ValueError("Invalid DROP TABLE syntax")
 
         return ParsedCommand(
             command_type='DROP_TABLE',
-            table_name=match.group(1)
+            table_name=parts[2]
         )
 
+    def _parse_begin(self, sql: str) -> ParsedCommand:
+        """Parse BEGIN [TRANSACTION] command"""
+        return ParsedCommand(command_type='BEGIN')
+
+    def _parse_commit(self, sql: str) -> ParsedCommand:
+        """Parse COMMIT command"""
+        return ParsedCommand(command_type='COMMIT')
+
+    def _parse_rollback(self, sql: str) -> ParsedCommand:
+        """Parse ROLLBACK command"""
+        return ParsedCommand(command_type='ROLLBACK')
+
     def _parse_create_index(self, sql: str) -> ParsedCommand:
         """Parse CREATE INDEX command"""
-        # Pattern: CREATE INDEX ON table_name (column_name)
-        match = re.match(r'CREATE INDEX ON (\w+) \((\w+)\)', sql, re.IGNORECASE)
+        # Pattern: CREATE INDEX ON table_name (column_name) - fixed token
+        # shape, so a plain split beats the regex machinery
+        parts = sql.split(' ')
 
-        if not match:
+        if (len(parts) != 5 or parts[2].upper() != 'ON'
+                or not parts[4].startswith('(') or not parts[4].endswith(')')
+                or len(parts[4]) < 3):
             raise ValueError("Invalid CREATE INDEX syntax")
 
         return ParsedCommand(
             command_type='CREATE_INDEX',
-            table_name=match.group(1),
-            column_name=match.group(2)
+            table_name=parts[3],
+            column_name=parts[4][1:-1]
         )
 
     def _parse_where(self, where_clause: str) -> Dict[str, Any]:
@@ -305,25 +409,42 @@ class SQLParser:
 
     def _parse_values(self, values_str: str) -> List[Any]:
         """Parse comma-separated values"""
+        # Hand-written linear scan: one pass, no regex engine and no
+        # Match allocations per literal. Quoted strings (commas inside
+        # them included) are sliced out directly; every other token runs
+        # to the next comma and goes through _parse_value.
         values = []
-
-        # Split by comma, but respect quoted strings
-        current = ''
-        in_quotes = False
-
-        for char in values_str:
-            if char == "'" and (not current or current[-1] != '\\'):
-                in_quotes = not in_quotes
-                current += char
-            elif char == ',' and not in_quotes:
-                values.append(self._parse_value(current.strip()))
-                current = ''
+        s = values_str
+        n = len(s)
+        i = 0
+
+        while i < n:
+            if s[i] == ' ':
+                i += 1
+                continue
+
+            if s[i] == "'":
+                # Quoted string: scan to the closing quote, stepping over
+                # backslash escapes
+                j = i + 1
+                while j < n and s[j] != "'":
+                    if s[j] == '\\':
+                        j += 1
+                    j += 1
+                values.append(s[i + 1:j])
+                # Move past the closing quote and the separating comma
+                i = s.find(',', j + 1)
+                if i == -1:
+                    break
+                i += 1
             else:
-                current += char
-
-        # Don't forget the last value
-        if current.strip():
-            values.append(self._parse_value(current.strip()))
+                j = s.find(',', i)
+                if j == -1:
+                    j = n
+                token = s[i:j].strip()
+                if token:
+                    values.append(self._parse_value(token))
+                i = j + 1
 
         return values
 
@@ -341,17 +462,27 @@ class SQLParser:
         if val_str.startswith("'") and val_str.endswith("'"):
             return val_str[1:-1]  # Remove quotes
 
-        # Try integer
-        try:
+        # Numbers: integers first, then floats (decimal point or exponent)
+        if _RE_INT.fullmatch(val_str):
             return int(val_str)
-        except ValueError:
-            pass
 
-        # Try float
-        try:
+        if _RE_FLOAT.fullmatch(val_str):
             return float(val_str)
-        except ValueError:
-            pass
 
         # If nothing works, treat as string
-        return val_str
\ No newline at end of file
+        return val_str
+
+    # Keyword(s) -> parse handler. Two-word commands key on their first
+    # two tokens; single-keyword commands key on (token, None).
+    _DISPATCH = {
+        ('CREATE', 'TABLE'): _parse_create_table,
+        ('CREATE', 'INDEX'): _parse_create_index,
+        ('INSERT', 'INTO'): _parse_insert,
+        ('DELETE', 'FROM'): _parse_delete,
+        ('DROP', 'TABLE'): _parse_drop_table,
+        ('SELECT', None): _parse_select,
+        ('UPDATE', None): _parse_update,
+        ('BEGIN', None): _parse_begin,
+        ('COMMIT', None): _parse_commit,
+        ('ROLLBACK', None): _parse_rollback,
+    }
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Simple REPL interface for the RDBMS."""
 
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Set
 
 from rdbms.parser import SQLParser, ParsedCommand
 from rdbms.table import Table
@@ -14,6 +14,16 @@ class Database:
         self.storage = Storage(db_path)
         self.tables: Dict[str, Table] = {}
         self.parser = SQLParser()
+
+        # Transaction state: outside a transaction every mutation is saved
+        # immediately (autocommit); inside one, touched tables are only
+        # marked dirty and written in a single batch on COMMIT, and
+        # dropped tables keep their files until COMMIT so ROLLBACK can
+        # restore them.
+        self._in_transaction = False
+        self._dirty_tables: Set[str] = set()
+        self._dropped_tables: Set[str] = set()
+
         self._load_tables()
 
     def _load_tables(self) -> None:
@@ -24,11 +34,47 @@ class Database:
                 self.tables[table_name] = Table.from_dict(table_data)
 
     def _save_table(self, table_name: str) -> bool:
-        """Save a table to storage."""
+        """Save a table to storage (deferred inside a transaction)."""
+        if self._in_transaction:
+            self._dirty_tables.add(table_name)
+            return True
         if table_name in self.tables:
             return self.storage.save_table(table_name, self.tables[table_name].to_dict())
         return False
 
+    def flush(self) -> None:
+        """Write any deferred table saves and deletions to disk."""
+        # While a transaction is open the deferred work is uncommitted:
+        # leave it pending so ROLLBACK can still discard it. COMMIT
+        # clears the flag before flushing.
+        if self._in_transaction:
+            return
+
+        self.storage.save_tables({
+            table_name: self.tables[table_name].to_dict()
+            for table_name in self._dirty_tables
+            if table_name in self.tables
+        })
+        self._dirty_tables.clear()
+
+        for table_name in self._dropped_tables:
+            self.storage.delete_table(table_name)
+        self._dropped_tables.clear()
+
+    def close(self) -> None:
+        """Flush pending writes; the database stays usable afterwards."""
+        self.flush()
+
+    def __enter__(self) -> 'Database':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Don't persist work the caller never committed: skip the flush
+        # when an exception is propagating or a transaction is still
+        # open when the block ends
+        if exc_type is None and not self._in_transaction:
+            self.close()
+
     def execute(self, sql: str) -> Optional[Any]:
         """Execute a SQL command and return the result."""
         cmd = self.parser.parse(sql)
@@ -40,6 +86,10 @@ class Database:
                          primary_key=cmd.primary_key,
                          unique_constraints=cmd.unique_constraints or [])
             self.tables[cmd.table_name] = table
+            # Re-creating a table dropped earlier in this transaction
+            # cancels the pending file deletion, or COMMIT would delete
+            # the file the save just wrote
+            self._dropped_tables.discard(cmd.table_name)
             self._save_table(cmd.table_name)
             return f"Table '{cmd.table_name}' created"
 
@@ -47,13 +97,26 @@ class Database:
             if cmd.table_name not in self.tables:
                 raise ValueError(f"Table '{cmd.table_name}' does not exist")
             del self.tables[cmd.table_name]
-            self.storage.delete_table(cmd.table_name)
+            if self._in_transaction:
+                # Keep the file so ROLLBACK can restore the table; a
+                # pending save for it would be pointless now
+                self._dirty_tables.discard(cmd.table_name)
+                self._dropped_tables.add(cmd.table_name)
+            else:
+                self.storage.delete_table(cmd.table_name)
             return f"Table '{cmd.table_name}' dropped"
 
         elif cmd.command_type == 'INSERT':
             if cmd.table_name not in self.tables:
                 raise ValueError(f"Table '{cmd.table_name}' does not exist")
-            self.tables[cmd.table_name].insert(cmd.values)
+            # Copy the values: the parsed command may be cached and reused,
+            # so the table must not share its lists.
+            if cmd.rows is not None:
+                count = self.tables[cmd.table_name].insert_many(
+                    [list(row) for row in cmd.rows])
+                self._save_table(cmd.table_name)
+                return f"{count} row(s) inserted"
+            self.tables[cmd.table_name].insert(list(cmd.values))
             self._save_table(cmd.table_name)
             return f"1 row inserted"
 
@@ -84,6 +147,38 @@ class Database:
             return self.tables[cmd.table_name].join(
                 self.tables[cmd.join_table], cmd.left_column, cmd.right_column)
 
+        elif cmd.command_type == 'BEGIN':
+            if self._in_transaction:
+                raise ValueError("Transaction already in progress")
+            self._in_transaction = True
+            return "Transaction started"
+
+        elif cmd.command_type == 'COMMIT':
+            if not self._in_transaction:
+                raise ValueError("No transaction in progress")
+            self._in_transaction = False
+            # Write each touched table once, no matter how many statements
+            # modified it during the transaction
+            self.flush()
+            return "Transaction committed"
+
+        elif cmd.command_type == 'ROLLBACK':
+            if not self._in_transaction:
+                raise ValueError("No transaction in progress")
+            self._in_transaction = False
+            # Restore each touched or dropped table from its last saved
+            # state; tables created inside the transaction have no file
+            # and are dropped
+            for table_name in self._dirty_tables | self._dropped_tables:
+                table_data = self.storage.load_table(table_name)
+                if table_data:
+                    self.tables[table_name] = Table.from_dict(table_data)
+                else:
+                    self.tables.pop(table_name, None)
+            self._dirty_tables.clear()
+            self._dropped_tables.clear()
+            return "Transaction rolled back"
+
         elif cmd.command_type == 'CREATE_INDEX':
             if cmd.table_name not in self.tables:
                 raise ValueError(f"Table '{cmd.table_name}' does not exist")
@@ -2,6 +2,11 @@ import os
 import json
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 
 class Storage:
     """
@@ -35,15 +40,58 @@ class Storage:
         try:
             table_file = os.path.join(self.db_path, f'{table_name}.json')
 
-            with open(table_file, 'w') as f:
-                json.dump(table_data, f, indent=2)
-
+            # Write to a temporary file in the same directory and rename
+            # it over the real one: os.replace is atomic, so a crash
+            # mid-write can never leave a truncated table file behind.
+            tmp_file = f'{table_file}.tmp'
+
+            # orjson serializes several times faster than the stdlib and
+            # is already compact; fall back to compact stdlib json when
+            # it is not installed.
+            if orjson is not None:
+                # OPT_NON_STR_KEYS matches stdlib behavior for index
+                # buckets keyed by int/bool column values
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(table_data, option=orjson.OPT_NON_STR_KEYS))
+                    f.flush()
+                    # Force the data to disk before the rename makes it
+                    # visible, so the replaced file is never empty after
+                    # a power loss
+                    os.fsync(f.fileno())
+            else:
+                with open(tmp_file, 'w') as f:
+                    json.dump(table_data, f, separators=(',', ':'))
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            os.replace(tmp_file, table_file)
             return True
 
         except Exception as e:
             print(f"Error saving table {table_name}: {e}")
             return False
 
+    def save_tables(self, tables: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Save several tables in one batch.
+
+        Each table still goes through the atomic tmp-file + replace path,
+        so this is simply save_table applied to every entry; batching the
+        calls keeps one durability point per flush for callers like
+        transaction commit.
+
+        Args:
+            tables: Mapping of table name to table data.
+
+        Returns:
+            True if every table saved successfully, False otherwise.
+        """
+        ok = True
+        for table_name, table_data in tables.items():
+            if not self.save_table(table_name, table_data):
+                ok = False
+        return ok
+
     def load_table(self, table_name: str) -> Optional[Dict[str, Any]]:
         """
         Load table data from a JSON file.
@@ -60,10 +108,12 @@ class Storage:
             if not os.path.exists(table_file):
                 return None
 
-            with open(table_file, 'r') as f:
-                table_data = json.load(f)
+            if orjson is not None:
+                with open(table_file, 'rb') as f:
+                    return orjson.loads(f.read())
 
-            return table_data
+            with open(table_file, 'r') as f:
+                return json.load(f)
 
         except Exception as e:
             print(f"Error loading table {table_name}: {e}")
@@ -77,13 +127,13 @@ class Storage:
             List of table names.
         """
         try:
-            # Get all .json files in the database directory
-            json_files = [f for f in os.listdir(self.db_path) if f.endswith('.json')]
-
-            # Extract table names by removing the .json extension
-            table_names = [f[:-5] for f in json_files]
-
-            return table_names
+            # os.scandir yields entries with cached file-type info, so this
+            # avoids the extra stat call per entry that listdir-based
+            # filtering would need. The .json suffix is stripped to get
+            # the table name.
+            with os.scandir(self.db_path) as entries:
+                return [entry.name[:-5] for entry in entries
+                        if entry.is_file() and entry.name.endswith('.json')]
 
         except Exception as e:
             print(f"Error listing tables: {e}")
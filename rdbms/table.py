@@ -1,3 +1,4 @@
+import sys
 from typing import List, Any, Dict, Optional
 from enum import Enum
 
@@ -10,6 +11,43 @@ class DataType(Enum):
     BOOL = "BOOL"
 
 
+# Compact numeric code per type name. A table keeps its schema as a bytes
+# string of these codes, which is cheaper to store and index than repeated
+# string comparisons on the type names.
+_TYPE_CODES = {'INT': 0, 'TEXT': 1, 'FLOAT': 2, 'BOOL': 3}
+
+# One type-check predicate per type code, resolved once instead of walking
+# an if/elif chain for every value. bool is excluded from INT and FLOAT
+# because it subclasses int.
+_CHECKERS = (
+    lambda v: isinstance(v, int) and not isinstance(v, bool),    # INT
+    lambda v: isinstance(v, str),                                # TEXT
+    lambda v: isinstance(v, float) and not isinstance(v, bool),  # FLOAT
+    lambda v: isinstance(v, bool),                               # BOOL
+)
+
+# Name-keyed view of the same predicates, for callers that still hold a
+# type string (validate_value)
+_VALIDATORS = {name: _CHECKERS[code] for name, code in _TYPE_CODES.items()}
+
+# Below this many rows a straight scan beats the index lookup overhead
+_SMALL_TABLE_THRESHOLD = 4
+
+# Equality lookups on an unindexed column before an index is built for
+# it automatically
+_AUTO_INDEX_THRESHOLD = 8
+
+# Rough selectivity rank per type code, used to order multi-column WHERE
+# clauses: equality on numeric columns tends to reject rows sooner than
+# TEXT, and BOOL only splits the table in two.
+_SELECTIVITY_RANK = {
+    _TYPE_CODES['INT']: 1,
+    _TYPE_CODES['FLOAT']: 2,
+    _TYPE_CODES['TEXT']: 3,
+    _TYPE_CODES['BOOL']: 4,
+}
+
+
 class Table:
     """
     Represents a database table with schema and data.
@@ -56,13 +94,28 @@ class Table:
                 raise ValueError(f"Invalid data type: {col_type}. Must be one of {self.VALID_TYPES}")
 
         self.name = name
-        self.columns = columns
+        # Interned names turn the frequent column-name comparisons into
+        # pointer checks
+        self.columns = [sys.intern(col) for col in columns]
         self.types = types
         self.rows: List[List[Any]] = []
 
+        # Compact schema codes, and per-column validators resolved from them
+        self._type_codes = bytes(_TYPE_CODES[col_type] for col_type in types)
+        self._validators = [_CHECKERS[code] for code in self._type_codes]
+
+        # Column name -> position, for O(1) lookups instead of list.index
+        self._col_idx = {col: idx for idx, col in enumerate(self.columns)}
+
+        # Column count, cached for the per-row length checks
+        self._ncols = len(self.columns)
+
+        # Frozen column-name set for O(1) membership checks
+        self._column_set = frozenset(self.columns)
+
         # Validate primary key column exists
         if primary_key is not None:
-            if primary_key not in columns:
+            if primary_key not in self._column_set:
                 raise ValueError(f"Primary key column '{primary_key}' does not exist in table")
 
         self.primary_key = primary_key
@@ -72,12 +125,54 @@ class Table:
             unique_constraints = []
 
         for col in unique_constraints:
-            if col not in columns:
+            if col not in self._column_set:
                 raise ValueError(f"Unique constraint column '{col}' does not exist in table")
 
         self.unique_constraints: List[str] = unique_constraints
         self.indexes: Dict[str, Dict[Any, List[int]]] = {}
 
+        # Hash sets of the values currently held by the primary key and
+        # each unique column, giving O(1) duplicate checks on insert
+        # instead of a scan over all rows
+        self._pk_values: set = set()
+        self._unique_values: Dict[str, set] = {col: set() for col in unique_constraints}
+
+        # Equality-lookup counts per unindexed WHERE column; once a
+        # column crosses _AUTO_INDEX_THRESHOLD it gets an index built
+        # on demand
+        self._where_hits: Dict[str, int] = {}
+
+        # Cached to_dict payload, rebuilt lazily after any mutation.
+        # Needed because delete/from_dict can rebind self.rows, which
+        # would leave a previously built dict pointing at the old list.
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        self._dirty = True
+
+        self._rebuild_maintenance_plan()
+
+    def _rebuild_maintenance_plan(self) -> None:
+        """
+        Precompute insert's constraint checks and index updates.
+
+        Each entry resolves a column position and its target structure
+        once, so insert walks the row a single time per constraint and
+        index instead of re-resolving names on every call. Must be
+        re-run whenever the constraint sets or index dicts are replaced.
+        """
+        # (column position, value set, unique column name or None for PK)
+        self._check_ops = []
+        if self.primary_key is not None:
+            self._check_ops.append(
+                (self.get_column_index(self.primary_key), self._pk_values, None))
+        for unique_col in self.unique_constraints:
+            self._check_ops.append(
+                (self.get_column_index(unique_col),
+                 self._unique_values[unique_col], unique_col))
+
+        # (column position, posting dict)
+        self._index_ops = [(self.get_column_index(col), index)
+                           for col, index in self.indexes.items()]
+
     def validate_value(self, value: Any, expected_type: str) -> bool:
         """
         Validate that a value matches the expected type.
@@ -89,19 +184,8 @@ class Table:
         Returns:
             True if value matches type, False otherwise
         """
-        if expected_type == 'INT':
-            return isinstance(value, int) and not isinstance(value, bool)
-
-        elif expected_type == 'TEXT':
-            return isinstance(value, str)
-
-        elif expected_type == 'FLOAT':
-            return isinstance(value, float) and not isinstance(value, bool)
-
-        elif expected_type == 'BOOL':
-            return isinstance(value, bool)
-
-        return False
+        validator = _VALIDATORS.get(expected_type)
+        return validator(value) if validator is not None else False
 
     def validate_row(self, row: List[Any]) -> bool:
         """
@@ -113,16 +197,11 @@ class Table:
         Returns:
             True if row is valid, False otherwise
         """
-        # Check correct number of values
-        if len(row) != len(self.columns):
-            return False
-
-        # Check each value matches its column type
-        for value, col_type in zip(row, self.types):
-            if not self.validate_value(value, col_type):
-                return False
-
-        return True
+        # Check correct number of values, then each value against its
+        # column's precomputed validator
+        return (len(row) == self._ncols
+                and all(validator(value)
+                        for value, validator in zip(row, self._validators)))
 
     def get_column_index(self, column_name: str) -> int:
         """
@@ -138,8 +217,8 @@ class Table:
             ValueError: If column doesn't exist
         """
         try:
-            return self.columns.index(column_name)
-        except ValueError:
+            return self._col_idx[column_name]
+        except KeyError:
             raise ValueError(f"Column '{column_name}' does not exist in table '{self.name}'")
 
     def to_dict(self) -> Dict[str, Any]:
@@ -149,15 +228,20 @@ class Table:
         Returns:
             Dictionary representation of the table
         """
-        return {
-            'name': self.name,
-            'columns': self.columns,
-            'types': self.types,
-            'rows': self.rows,
-            'primary_key': self.primary_key,
-            'unique_constraints': self.unique_constraints,
-            'indexes': self.indexes
-        }
+        # The payload holds live references to rows/indexes, so it only
+        # needs rebuilding when a mutation may have rebound one of them
+        if self._dirty or self._dict_cache is None:
+            self._dict_cache = {
+                'name': self.name,
+                'columns': self.columns,
+                'types': self.types,
+                'rows': self.rows,
+                'primary_key': self.primary_key,
+                'unique_constraints': self.unique_constraints,
+                'indexes': self.indexes
+            }
+            self._dirty = False
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Table':
@@ -177,11 +261,85 @@ class Table:
             primary_key=data.get('primary_key'),
             unique_constraints=data.get('unique_constraints', [])
         )
-        table.rows = data.get('rows', [])
-        table.indexes = data.get('indexes', {})
+        # Stored rows were validated when they were first inserted, so
+        # replay them through insert_unchecked, which maintains the
+        # constrained-value sets without re-checking anything
+        for row in data.get('rows', []):
+            table.insert_unchecked(row)
+
+        # Rebuild listed indexes from the rows rather than trusting the
+        # stored postings: a JSON round-trip turns non-string keys (ints,
+        # bools) into strings, which would break index lookups.
+        for col_name in data.get('indexes', {}):
+            table.create_index(col_name)
 
         return table
 
+    def _where_pairs(self, where: Optional[Dict[str, Any]]) -> Optional[List[tuple]]:
+        """
+        Resolve a WHERE clause to (column position, value) pairs.
+
+        Args:
+            where: Dictionary of column:value pairs, or None
+
+        Returns:
+            List of (position, value) pairs, or None if where is None.
+            Multi-condition clauses are ordered by estimated selectivity
+            (primary key first, TEXT before BOOL) so the AND chain
+            short-circuits as early as possible.
+
+        Raises:
+            ValueError: If a WHERE column doesn't exist
+        """
+        if where is None:
+            return None
+
+        pairs = [(self.get_column_index(col), val) for col, val in where.items()]
+
+        if len(pairs) > 1:
+            pk_idx = (self.get_column_index(self.primary_key)
+                      if self.primary_key is not None else None)
+            pairs.sort(key=lambda pair: (0 if pair[0] == pk_idx
+                                         else _SELECTIVITY_RANK[self._type_codes[pair[0]]]))
+
+        return pairs
+
+    def _indexed_positions(self, where: Optional[Dict[str, Any]]) -> Optional[List[int]]:
+        """
+        Look up candidate row positions for a WHERE clause via an index.
+
+        Args:
+            where: Dictionary of column:value pairs, or None
+
+        Returns:
+            Sorted row positions matching one indexed condition, or None
+            when no WHERE column has an index (callers fall back to a
+            full scan)
+        """
+        # Tiny tables: the dict lookup plus sort costs more than just
+        # scanning the handful of rows
+        if len(self.rows) <= _SMALL_TABLE_THRESHOLD:
+            return None
+
+        if where is not None:
+            for where_col, where_val in where.items():
+                index = self.indexes.get(where_col)
+                if index is not None:
+                    return sorted(index.get(where_val, []))
+
+            # No index covers this clause: count the lookups, and build
+            # an index on demand once a column proves hot. The call that
+            # crosses the threshold pays for the build; later lookups on
+            # the column become dict probes.
+            for where_col in where:
+                hits = self._where_hits.get(where_col, 0) + 1
+                if hits >= _AUTO_INDEX_THRESHOLD:
+                    self._where_hits.pop(where_col, None)
+                    self.create_index(where_col)
+                    return sorted(self.indexes[where_col].get(where[where_col], []))
+                self._where_hits[where_col] = hits
+        return None
+
     def insert(self, row: List[Any]) -> bool:
         """
         Insert a new row into the table.
@@ -196,53 +354,169 @@ class Table:
             ValueError: If row validation fails
         """
         # Validate row length
-        if len(row) != len(self.columns):
+        if len(row) != self._ncols:
             raise ValueError(
-                f"Expected {len(self.columns)} values, got {len(row)}"
+                f"Expected {self._ncols} values, got {len(row)}"
             )
 
         # Validate each value type
-        for i, (value, col_type, col_name) in enumerate(zip(row, self.types, self.columns)):
-            if not self.validate_value(value, col_type):
+        for value, validator, col_type, col_name in zip(
+                row, self._validators, self.types, self.columns):
+            if not validator(value):
                 raise ValueError(
                     f"Invalid type for column '{col_name}': expected {col_type}, "
                     f"got {type(value).__name__}"
                 )
 
-        # Check primary key constraint
-        if self.primary_key is not None:
-            pk_idx = self.get_column_index(self.primary_key)
-            pk_value = row[pk_idx]
+        # Check constraints through the precomputed plan (set membership,
+        # not a row scan)
+        for col_idx, value_set, unique_col in self._check_ops:
+            value = row[col_idx]
+            if value in value_set:
+                if unique_col is None:
+                    raise ValueError(f"Duplicate primary key value: {value}")
+                raise ValueError(
+                    f"Duplicate value for unique column '{unique_col}': {value}")
 
-            # Check for duplicate primary key
-            for existing_row in self.rows:
-                if existing_row[pk_idx] == pk_value:
-                    raise ValueError(f"Duplicate primary key value: {pk_value}")
+        # Add the row
+        row_position = len(self.rows)
+        self.rows.append(row)
 
-        # Check unique constraints
-        for unique_col in self.unique_constraints:
-            col_idx = self.get_column_index(unique_col)
-            value = row[col_idx]
+        # Record the constrained values and update indexes, all through
+        # positions resolved when the plan was built
+        for col_idx, value_set, _ in self._check_ops:
+            value_set.add(row[col_idx])
 
-            # Check for duplicate unique value
-            for existing_row in self.rows:
-                if existing_row[col_idx] == value:
-                    raise ValueError(f"Duplicate value for unique column '{unique_col}': {value}")
+        for col_idx, index in self._index_ops:
+            index.setdefault(row[col_idx], []).append(row_position)
 
-        # Add the row
+        self._dirty = True
+        return True
+
+    def insert_unchecked(self, row: List[Any]) -> None:
+        """
+        Append a row without validation or duplicate checks.
+
+        For trusted callers (bulk restores of already-validated data)
+        that need to skip the per-row checking cost. Constraint sets
+        and indexes are still maintained. A bad row silently corrupts
+        the table, so prefer insert/insert_many unless correctness is
+        assured externally.
+
+        Args:
+            row: List of values to append
+        """
         row_position = len(self.rows)
         self.rows.append(row)
 
-        # Update indexes
+        for col_idx, value_set, _ in self._check_ops:
+            value_set.add(row[col_idx])
+
+        for col_idx, index in self._index_ops:
+            index.setdefault(row[col_idx], []).append(row_position)
+
+        self._dirty = True
+
+    def insert_many(self, rows: List[List[Any]]) -> int:
+        """
+        Insert multiple rows in a single batch.
+
+        Every row is validated (types and constraints, including
+        duplicates within the batch) before any is added, so a failing
+        batch leaves the table unchanged. The rows are then appended and
+        the constraint sets and indexes updated in one pass each, which
+        is considerably cheaper than repeated insert calls.
+
+        Args:
+            rows: List of rows to insert
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            ValueError: If any row fails validation
+        """
+        pk_idx = (self.get_column_index(self.primary_key)
+                  if self.primary_key is not None else None)
+        unique_indices = [(col, self.get_column_index(col))
+                          for col in self.unique_constraints]
+
+        # Values the batch itself introduces, to catch duplicates between
+        # its own rows
+        batch_pk_values: set = set()
+        batch_unique_values = {col: set() for col in self.unique_constraints}
+
+        for row in rows:
+            if len(row) != self._ncols:
+                raise ValueError(
+                    f"Expected {self._ncols} values, got {len(row)}"
+                )
+
+            for value, validator, col_type, col_name in zip(
+                    row, self._validators, self.types, self.columns):
+                if not validator(value):
+                    raise ValueError(
+                        f"Invalid type for column '{col_name}': expected {col_type}, "
+                        f"got {type(value).__name__}"
+                    )
+
+            if pk_idx is not None:
+                pk_value = row[pk_idx]
+                if pk_value in self._pk_values or pk_value in batch_pk_values:
+                    raise ValueError(f"Duplicate primary key value: {pk_value}")
+                batch_pk_values.add(pk_value)
+
+            for unique_col, col_idx in unique_indices:
+                value = row[col_idx]
+                if (value in self._unique_values[unique_col]
+                        or value in batch_unique_values[unique_col]):
+                    raise ValueError(
+                        f"Duplicate value for unique column '{unique_col}': {value}")
+                batch_unique_values[unique_col].add(value)
+
+        # Append the batch and fold its values into the constraint sets
+        start_position = len(self.rows)
+        self.rows.extend(rows)
+        self._pk_values |= batch_pk_values
+        for unique_col, _ in unique_indices:
+            self._unique_values[unique_col] |= batch_unique_values[unique_col]
+
+        # Update indexes once per column rather than once per row
         for col_name, index in self.indexes.items():
             col_idx = self.get_column_index(col_name)
-            value = row[col_idx]
+            for offset, row in enumerate(rows):
+                index.setdefault(row[col_idx], []).append(start_position + offset)
 
-            if value not in index:
-                index[value] = []
-            index[value].append(row_position)
+        self._dirty = True
+        return len(rows)
 
-        return True
+    def _scan_plan(self, columns: Optional[List[str]],
+                   where: Optional[Dict[str, Any]]) -> tuple:
+        """
+        Resolve a scan to (projection indices, WHERE pairs, candidates).
+
+        Shared by select and select_iter so the two scans cannot drift:
+        validates the requested columns, resolves the WHERE clause to
+        (position, value) pairs once, and narrows the candidate rows
+        through an index when one applies. Candidate positions are
+        sorted so results keep insertion order.
+
+        Raises:
+            ValueError: If column names are invalid
+        """
+        if columns is None:
+            columns = self.columns
+
+        column_indices = [self.get_column_index(col) for col in columns]
+        where_pairs = self._where_pairs(where)
+
+        positions = self._indexed_positions(where)
+        if positions is None:
+            candidate_rows = self.rows
+        else:
+            candidate_rows = [self.rows[pos] for pos in positions]
+
+        return column_indices, where_pairs, candidate_rows
 
     def select(self, columns: Optional[List[str]] = None,
                where: Optional[Dict[str, Any]] = None) -> List[List[Any]]:
@@ -259,36 +533,53 @@ class Table:
         Raises:
             ValueError: If column names are invalid
         """
-        # If no columns specified, return all columns
-        if columns is None:
-            columns = self.columns.copy()
+        # Fast path: no filter and no projection means fresh copies of
+        # every row, with none of the per-row machinery below
+        if columns is None and where is None:
+            return [row.copy() for row in self.rows]
 
-        # Validate all requested columns exist
-        column_indices = []
-        for col in columns:
-            column_indices.append(self.get_column_index(col))
+        column_indices, where_pairs, candidate_rows = self._scan_plan(columns, where)
 
-        # Filter rows based on WHERE conditions
-        filtered_rows = []
+        # Filter and project in a single comprehension: one pass over the
+        # candidates with no per-row append calls
+        if where_pairs is None:
+            return [[row[idx] for idx in column_indices]
+                    for row in candidate_rows]
 
-        for row in self.rows:
-            # Check if row matches WHERE conditions
-            if where is not None:
-                match = True
-                for where_col, where_val in where.items():
-                    col_idx = self.get_column_index(where_col)
-                    if row[col_idx] != where_val:
-                        match = False
-                        break
+        return [[row[idx] for idx in column_indices]
+                for row in candidate_rows
+                if all(row[idx] == val for idx, val in where_pairs)]
 
-                if not match:
-                    continue
+    def select_iter(self, columns: Optional[List[str]] = None,
+                    where: Optional[Dict[str, Any]] = None):
+        """
+        Lazily yield rows matching the criteria, one at a time.
 
-            # Extract requested columns from the row
-            result_row = [row[idx] for idx in column_indices]
-            filtered_rows.append(result_row)
+        Same semantics as select, but as a generator: callers that stop
+        early (existence checks, limits, streaming) never materialize
+        the full result. Each yielded row is a fresh list.
 
-        return filtered_rows
+        Args:
+            columns: List of column names to return (None = all columns)
+            where: Dictionary of column:value pairs for filtering (AND logic)
+
+        Yields:
+            Rows matching the criteria
+
+        Raises:
+            ValueError: If column names are invalid
+        """
+        if columns is None and where is None:
+            for row in self.rows:
+                yield row.copy()
+            return
+
+        column_indices, where_pairs, candidate_rows = self._scan_plan(columns, where)
+
+        for row in candidate_rows:
+            if where_pairs is None or all(row[idx] == val
+                                          for idx, val in where_pairs):
+                yield [row[idx] for idx in column_indices]
 
     def update(self, set_values: Dict[str, Any],
                where: Optional[Dict[str, Any]] = None) -> int:
@@ -324,92 +615,91 @@ class Table:
 
             update_indices[col_idx] = new_value
 
-        # Validate WHERE columns if provided
-        if where is not None:
-            for where_col in where.keys():
-                self.get_column_index(where_col)  # Just validate it exists
-
-        # Check if updating primary key
-        pk_idx = None
+        # Validate WHERE columns and resolve them to row positions once
+        where_pairs = self._where_pairs(where)
+
+        # Resolve the matching row positions up front (via an index when
+        # one covers a WHERE column), so the constraint checks below see
+        # the full update before any row is touched
+        positions = self._indexed_positions(where)
+        if positions is not None:
+            matched_positions = [pos for pos in positions
+                                 if all(self.rows[pos][idx] == val
+                                        for idx, val in where_pairs)]
+        elif where_pairs is not None:
+            matched_positions = [pos for pos, row in enumerate(self.rows)
+                                 if all(row[idx] == val
+                                        for idx, val in where_pairs)]
+        else:
+            matched_positions = range(len(self.rows))
+
+        # Check the primary key constraint against the value set: setting
+        # several rows to one value, or taking a value held by a row that
+        # is not being updated, is a duplicate. Raising here leaves the
+        # table untouched.
         if self.primary_key is not None and self.primary_key in set_values:
             pk_idx = self.get_column_index(self.primary_key)
             new_pk_value = set_values[self.primary_key]
 
-            # Check for duplicate primary key in existing rows
-            for row in self.rows:
-                # Skip rows that will be updated
-                should_update = True
-                if where is not None:
-                    for where_col, where_val in where.items():
-                        col_idx = self.get_column_index(where_col)
-                        if row[col_idx] != where_val:
-                            should_update = False
-                            break
-
-                # If this row won't be updated and has the new PK value, it's a duplicate
-                if not should_update and row[pk_idx] == new_pk_value:
+            if len(matched_positions) > 1:
+                raise ValueError(f"Duplicate primary key value: {new_pk_value}")
+
+            if new_pk_value in self._pk_values:
+                matched_pk_values = {self.rows[pos][pk_idx] for pos in matched_positions}
+                if new_pk_value not in matched_pk_values:
                     raise ValueError(f"Duplicate primary key value: {new_pk_value}")
 
-        # Check if updating unique constraint columns
-        unique_checks = {}
+        # Same check for each unique column being set
         for unique_col in self.unique_constraints:
-            if unique_col in set_values:
-                col_idx = self.get_column_index(unique_col)
-                new_value = set_values[unique_col]
-                unique_checks[col_idx] = (unique_col, new_value)
+            if unique_col not in set_values or not matched_positions:
+                continue
 
-        # Update matching rows
-        rows_updated = 0
-        updated_pk_values = set()
-        updated_unique_values = {col_idx: set() for col_idx in unique_checks.keys()}
+            col_idx = self.get_column_index(unique_col)
+            new_value = set_values[unique_col]
+
+            if len(matched_positions) > 1:
+                raise ValueError(
+                    f"Duplicate value for unique column '{unique_col}': {new_value}")
+
+            if new_value in self._unique_values[unique_col]:
+                matched_values = {self.rows[pos][col_idx] for pos in matched_positions}
+                if new_value not in matched_values:
+                    raise ValueError(
+                        f"Duplicate value for unique column '{unique_col}': {new_value}")
+
+        # Constrained columns whose value sets track updated values
+        tracked_sets = {}
+        if self.primary_key is not None:
+            tracked_sets[self.get_column_index(self.primary_key)] = self._pk_values
+        for unique_col in self.unique_constraints:
+            tracked_sets[self.get_column_index(unique_col)] = self._unique_values[unique_col]
+
+        # Apply the update, migrating index postings and constraint sets
+        # for any tracked column whose value changes (selects rely on the
+        # indexes staying in sync with the rows)
+        for row_pos in matched_positions:
+            row = self.rows[row_pos]
 
-        for row in self.rows:
-            # Check if row matches WHERE conditions
-            if where is not None:
-                match = True
-                for where_col, where_val in where.items():
-                    col_idx = self.get_column_index(where_col)
-                    if row[col_idx] != where_val:
-                        match = False
-                        break
-
-                if not match:
-                    continue
-
-            # If updating primary key, check for duplicates among updated rows
-            if pk_idx is not None:
-                new_pk_value = update_indices[pk_idx]
-                if new_pk_value in updated_pk_values:
-                    raise ValueError(f"Duplicate primary key value: {new_pk_value}")
-                updated_pk_values.add(new_pk_value)
-
-            # If updating unique columns, check for duplicates
-            for col_idx, (col_name, new_value) in unique_checks.items():
-                # Check against rows that won't be updated
-                for other_row in self.rows:
-                    should_update_other = True
-                    if where is not None:
-                        for where_col, where_val in where.items():
-                            other_col_idx = self.get_column_index(where_col)
-                            if other_row[other_col_idx] != where_val:
-                                should_update_other = False
-                                break
-
-                    if not should_update_other and other_row[col_idx] == new_value:
-                        raise ValueError(f"Duplicate value for unique column '{col_name}': {new_value}")
-
-                # Check against already updated rows
-                if new_value in updated_unique_values[col_idx]:
-                    raise ValueError(f"Duplicate value for unique column '{col_name}': {new_value}")
-                updated_unique_values[col_idx].add(new_value)
-
-            # Update the row
             for col_idx, new_value in update_indices.items():
+                old_value = row[col_idx]
                 row[col_idx] = new_value
 
-            rows_updated += 1
+                if old_value != new_value:
+                    index = self.indexes.get(self.columns[col_idx])
+                    if index is not None:
+                        bucket = index[old_value]
+                        bucket.remove(row_pos)
+                        if not bucket:
+                            del index[old_value]
+                        index.setdefault(new_value, []).append(row_pos)
+
+                    tracked = tracked_sets.get(col_idx)
+                    if tracked is not None:
+                        tracked.discard(old_value)
+                        tracked.add(new_value)
 
-        return rows_updated
+        self._dirty = True
+        return len(matched_positions)
 
     def delete(self, where: Optional[Dict[str, Any]] = None) -> int:
         """
@@ -424,41 +714,81 @@ class Table:
         Raises:
             ValueError: If column names are invalid
         """
-        # Validate WHERE columns if provided
-        if where is not None:
-            for where_col in where.keys():
-                self.get_column_index(where_col)  # Just validate it exists
-
-        # Find rows to delete
+        # Fast path: no filter clears the whole table without visiting
+        # any row
+        if where is None:
+            rows_deleted = len(self.rows)
+            self.rows = []
+            self._pk_values.clear()
+            for unique_values in self._unique_values.values():
+                unique_values.clear()
+            # clear() keeps the dict objects the maintenance plan holds
+            for index in self.indexes.values():
+                index.clear()
+            self._dirty = True
+            return rows_deleted
+
+        # Validate WHERE columns and resolve them to row positions once
+        where_pairs = self._where_pairs(where)
+
+        # Constrained columns whose value sets must forget deleted rows
+        pk_idx = (self.get_column_index(self.primary_key)
+                  if self.primary_key is not None else None)
+        unique_indices = [(col, self.get_column_index(col))
+                          for col in self.unique_constraints]
+
+        # With an indexed WHERE column, resolve the doomed positions up
+        # front so the filtering pass below is a set-membership check
+        # rather than a per-row condition evaluation
+        positions = self._indexed_positions(where)
+        delete_positions = None
+        if positions is not None:
+            delete_positions = {
+                pos for pos in positions
+                if all(self.rows[pos][idx] == val for idx, val in where_pairs)
+            }
+
+        # Find rows to delete, remembering where each survivor lands so
+        # index postings can be remapped instead of rebuilt
         rows_to_keep = []
         rows_deleted = 0
+        position_map: Dict[int, int] = {}
 
-        for row in self.rows:
+        for old_pos, row in enumerate(self.rows):
             # Check if row matches WHERE conditions
             should_delete = True
 
-            if where is not None:
-                match = True
-                for where_col, where_val in where.items():
-                    col_idx = self.get_column_index(where_col)
-                    if row[col_idx] != where_val:
-                        match = False
-                        break
-
-                should_delete = match
+            if delete_positions is not None:
+                should_delete = old_pos in delete_positions
+            elif where_pairs is not None:
+                should_delete = all(row[idx] == val for idx, val in where_pairs)
 
             if should_delete:
                 rows_deleted += 1
+                if pk_idx is not None:
+                    self._pk_values.discard(row[pk_idx])
+                for unique_col, col_idx in unique_indices:
+                    self._unique_values[unique_col].discard(row[col_idx])
             else:
+                position_map[old_pos] = len(rows_to_keep)
                 rows_to_keep.append(row)
 
         # Replace rows with filtered list
         self.rows = rows_to_keep
 
-        # Rebuild all indexes (simpler than tracking changes)
-        for col_name in list(self.indexes.keys()):
-            self.create_index(col_name)
-
+        # Remap each index's postings through the survivor positions;
+        # entries for deleted rows drop out and empty buckets are removed
+        if rows_deleted:
+            for index in self.indexes.values():
+                for value in list(index):
+                    bucket = [position_map[pos] for pos in index[value]
+                              if pos in position_map]
+                    if bucket:
+                        index[value] = bucket
+                    else:
+                        del index[value]
+
+        self._dirty = True
         return rows_deleted
 
     def create_index(self, column_name: str) -> None:
@@ -484,6 +814,8 @@ class Table:
             index[value].append(row_pos)
 
         self.indexes[column_name] = index
+        self._dirty = True
+        self._rebuild_maintenance_plan()
 
     def drop_index(self, column_name: str) -> None:
         """
@@ -499,6 +831,8 @@ class Table:
             raise ValueError(f"Index on column '{column_name}' does not exist")
 
         del self.indexes[column_name]
+        self._dirty = True
+        self._rebuild_maintenance_plan()
 
     def join(self, right_table: 'Table', left_column: str, right_column: str) -> List[List[Any]]:
         """
@@ -519,22 +853,44 @@ class Table:
         left_col_idx = self.get_column_index(left_column)
         right_col_idx = right_table.get_column_index(right_column)
 
-        # Perform nested loop join (simple but works)
-        results = []
-
-        for left_row in self.rows:
-            left_value = left_row[left_col_idx]
-
-            for right_row in right_table.rows:
-                right_value = right_row[right_col_idx]
-
-                # Check if values match
-                if left_value == right_value:
-                    # Combine rows: all columns from left + all columns from right
-                    combined_row = left_row + right_row
-                    results.append(combined_row)
-
-        return results
+        # Nothing can match if either side is empty; skip the hash build
+        if not self.rows or not right_table.rows:
+            return []
+
+        # Hash join, building the hash table over whichever side is
+        # smaller (the build table dominates memory use). Either way the
+        # output lists all columns from left then right, ordered by left
+        # row and then right-table insertion order, exactly as the old
+        # nested loop produced.
+        left_rows = self.rows
+        right_rows = right_table.rows
+
+        if len(left_rows) <= len(right_rows):
+            # Build on the left side: bucket left row positions by join
+            # value, probe with the right rows, collect each left row's
+            # matches, then emit them in left-row order.
+            buckets: Dict[Any, List[int]] = {}
+            for pos, left_row in enumerate(left_rows):
+                buckets.setdefault(left_row[left_col_idx], []).append(pos)
+
+            matches: List[List[List[Any]]] = [[] for _ in left_rows]
+            for right_row in right_rows:
+                for pos in buckets.get(right_row[right_col_idx], ()):
+                    matches[pos].append(right_row)
+
+            return [left_row + right_row
+                    for left_row, matched in zip(left_rows, matches)
+                    for right_row in matched]
+
+        # Build on the right side: bucket right rows by join value and
+        # probe with each left row
+        right_buckets: Dict[Any, List[List[Any]]] = {}
+        for right_row in right_rows:
+            right_buckets.setdefault(right_row[right_col_idx], []).append(right_row)
+
+        return [left_row + right_row
+                for left_row in left_rows
+                for right_row in right_buckets.get(left_row[left_col_idx], ())]
 
     def __repr__(self) -> str:
         """String representation of the table"""
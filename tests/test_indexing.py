@@ -230,4 +230,28 @@ class TestIndexing:
         table = Table('users', ['id', 'name'], ['INT', 'TEXT'])
 
         with pytest.raises(ValueError, match="Index on column 'name' does not exist"):
-            table.drop_index('name')
\ No newline at end of file
+            table.drop_index('name')
+
+    def test_repeated_where_lookups_build_index(self):
+        """Test that a hot WHERE column gets an index automatically"""
+        table = Table('users', ['id', 'name'], ['INT', 'TEXT'])
+        table.insert_many([[i, f'user{i}'] for i in range(10)])
+
+        for _ in range(8):
+            assert table.select(where={'name': 'user3'}) == [[3, 'user3']]
+
+        assert 'name' in table.indexes
+        assert table.indexes['name']['user3'] == [3]
+
+    def test_auto_index_stays_correct_after_writes(self):
+        """Test that an auto-built index tracks later mutations"""
+        table = Table('users', ['id', 'name'], ['INT', 'TEXT'])
+        table.insert_many([[i, f'user{i}'] for i in range(10)])
+
+        for _ in range(8):
+            table.select(where={'name': 'user3'})
+        assert 'name' in table.indexes
+
+        table.insert([10, 'user3'])
+        results = table.select(where={'name': 'user3'})
+        assert results == [[3, 'user3'], [10, 'user3']]
\ No newline at end of file
@@ -167,4 +167,76 @@ class TestInsertOperations:
         assert table.insert([3, 'Third log']) is True
 
         assert len(table.rows) == 3
-        assert table.rows[2] == [3, 'Third log']
\ No newline at end of file
+        assert table.rows[2] == [3, 'Third log']
+
+    def test_insert_many_appends_all_rows(self):
+        """Test that insert_many inserts the whole batch in order"""
+        table = Table('users', ['id', 'name'], ['INT', 'TEXT'])
+
+        count = table.insert_many([[1, 'Alice'], [2, 'Bob'], [3, 'Charlie']])
+
+        assert count == 3
+        assert table.rows == [[1, 'Alice'], [2, 'Bob'], [3, 'Charlie']]
+
+    def test_insert_many_invalid_row_leaves_table_unchanged(self):
+        """Test that a mid-batch invalid row aborts the whole batch"""
+        table = Table('users', ['id', 'name'], ['INT', 'TEXT'])
+        table.insert([1, 'Alice'])
+
+        with pytest.raises(ValueError, match="Invalid type for column 'id'"):
+            table.insert_many([[2, 'Bob'], ['three', 'Charlie'], [4, 'Diana']])
+
+        assert table.rows == [[1, 'Alice']]
+
+    def test_insert_many_duplicate_pk_within_batch(self):
+        """Test that a primary key duplicated inside the batch raises"""
+        table = Table('users', ['id', 'name'], ['INT', 'TEXT'], primary_key='id')
+
+        with pytest.raises(ValueError, match="Duplicate primary key value: 1"):
+            table.insert_many([[1, 'Alice'], [2, 'Bob'], [1, 'Eve']])
+
+        assert table.rows == []
+        # A failed batch must not leave stale values in the constraint set
+        assert table.insert([1, 'Alice']) is True
+
+    def test_insert_many_duplicate_unique_within_batch(self):
+        """Test that a unique value duplicated inside the batch raises"""
+        table = Table('users', ['id', 'email'], ['INT', 'TEXT'],
+                      unique_constraints=['email'])
+
+        with pytest.raises(ValueError, match="Duplicate value for unique column 'email'"):
+            table.insert_many([[1, 'a@test.com'], [2, 'a@test.com']])
+
+        assert table.rows == []
+
+    def test_insert_unchecked_skips_constraint_checks(self):
+        """Test that insert_unchecked trusts the caller completely"""
+        table = Table('users', ['id', 'name'], ['INT', 'TEXT'], primary_key='id')
+        table.insert([1, 'Alice'])
+
+        # No validation or constraint check: a duplicate key slips through
+        table.insert_unchecked([1, 'Imposter'])
+
+        assert table.rows == [[1, 'Alice'], [1, 'Imposter']]
+
+    def test_insert_unchecked_maintains_sets_and_indexes(self):
+        """Test that insert_unchecked still updates constraint sets and indexes"""
+        table = Table('users', ['id', 'name'], ['INT', 'TEXT'], primary_key='id')
+        table.create_index('name')
+
+        table.insert_unchecked([1, 'Alice'])
+
+        assert table.indexes['name']['Alice'] == [0]
+        # The recorded key value is seen by later checked inserts
+        with pytest.raises(ValueError, match="Duplicate primary key value: 1"):
+            table.insert([1, 'Bob'])
+
+    def test_insert_many_conflict_with_existing_rows(self):
+        """Test that a batch clashing with already-inserted rows aborts"""
+        table = Table('users', ['id', 'name'], ['INT', 'TEXT'], primary_key='id')
+        table.insert([1, 'Alice'])
+
+        with pytest.raises(ValueError, match="Duplicate primary key value: 1"):
+            table.insert_many([[2, 'Bob'], [1, 'Eve']])
+
+        assert table.rows == [[1, 'Alice']]
\ No newline at end of file
@@ -79,6 +79,48 @@ class TestSQLParser:
 
         assert cmd.values == [-10, -99.99]
 
+    def test_parse_insert_single_row_has_no_rows(self, parser):
+        """Test that single-row INSERT keeps the values shape"""
+        sql = "INSERT INTO users VALUES (1, 'Alice')"
+        cmd = parser.parse(sql)
+
+        assert cmd.values == [1, 'Alice']
+        assert cmd.rows is None
+
+    def test_parse_insert_multi_row(self, parser):
+        """Test parsing multi-row INSERT"""
+        sql = "INSERT INTO users VALUES (1, 'Alice'), (2, 'Bob'), (3, 'Charlie')"
+        cmd = parser.parse(sql)
+
+        assert cmd.command_type == 'INSERT'
+        assert cmd.table_name == 'users'
+        assert cmd.values is None
+        assert cmd.rows == [[1, 'Alice'], [2, 'Bob'], [3, 'Charlie']]
+
+    def test_parse_insert_multi_row_mixed_types(self, parser):
+        """Test multi-row INSERT with different data types"""
+        sql = "INSERT INTO products VALUES (1, 'Widget', 9.99, true), (2, 'Gadget', 4.5, false)"
+        cmd = parser.parse(sql)
+
+        assert cmd.rows == [[1, 'Widget', 9.99, True], [2, 'Gadget', 4.5, False]]
+
+    def test_parse_insert_multi_row_commas_in_strings(self, parser):
+        """Test that commas inside quoted strings don't split rows"""
+        sql = "INSERT INTO users VALUES (1, 'Doe, Jane'), (2, 'Roe, Richard')"
+        cmd = parser.parse(sql)
+
+        assert cmd.rows == [[1, 'Doe, Jane'], [2, 'Roe, Richard']]
+
+    def test_parse_insert_multi_row_missing_comma(self, parser):
+        """Test multi-row INSERT without a comma between groups raises error"""
+        with pytest.raises(ValueError, match="Invalid INSERT syntax"):
+            parser.parse("INSERT INTO users VALUES (1, 2) (3, 4)")
+
+    def test_parse_insert_multi_row_trailing_junk(self, parser):
+        """Test multi-row INSERT with stray text after the groups raises error"""
+        with pytest.raises(ValueError, match="Invalid INSERT syntax"):
+            parser.parse("INSERT INTO users VALUES (1, 'Alice'), oops")
+
     # SELECT tests
     def test_parse_select_all(self, parser):
         """Test parsing SELECT *"""
@@ -35,6 +35,23 @@ class TestDatabase:
         assert result == "1 row inserted"
         assert len(db.tables['users'].rows) == 1
 
+    def test_insert_multi_row(self, db):
+        """Test multi-row INSERT."""
+        db.execute("CREATE TABLE users (id INT, name TEXT)")
+        result = db.execute("INSERT INTO users VALUES (1, 'Alice'), (2, 'Bob')")
+        assert result == "2 row(s) inserted"
+        assert db.tables['users'].rows == [[1, 'Alice'], [2, 'Bob']]
+
+    def test_insert_multi_row_all_or_nothing(self, db):
+        """Test that a bad row aborts the whole multi-row INSERT."""
+        db.execute("CREATE TABLE users (id INT PRIMARY KEY, name TEXT)")
+        db.execute("INSERT INTO users VALUES (1, 'Alice')")
+
+        with pytest.raises(ValueError, match="Duplicate primary key"):
+            db.execute("INSERT INTO users VALUES (2, 'Bob'), (1, 'Eve')")
+
+        assert db.tables['users'].rows == [[1, 'Alice']]
+
     def test_select(self, db):
         """Test SELECT."""
         db.execute("CREATE TABLE users (id INT, name TEXT)")
@@ -121,6 +138,164 @@ class TestDatabase:
         with pytest.raises(ValueError, match="Duplicate value for unique column"):
             db.execute("INSERT INTO users VALUES (2, 'alice@test.com')")
 
+    def test_transaction_commit_persists(self, temp_dir):
+        """Test that committed changes survive a reload."""
+        db1 = Database(temp_dir)
+        db1.execute("CREATE TABLE users (id INT, name TEXT)")
+        db1.execute("BEGIN")
+        db1.execute("INSERT INTO users VALUES (1, 'Alice')")
+        result = db1.execute("COMMIT")
+        assert result == "Transaction committed"
+
+        db2 = Database(temp_dir)
+        assert db2.execute("SELECT * FROM users") == [[1, 'Alice']]
+
+    def test_transaction_rollback_insert(self, db):
+        """Test that ROLLBACK discards an uncommitted INSERT."""
+        db.execute("CREATE TABLE users (id INT, name TEXT)")
+        db.execute("INSERT INTO users VALUES (1, 'Alice')")
+
+        db.execute("BEGIN")
+        db.execute("INSERT INTO users VALUES (2, 'Bob')")
+        result = db.execute("ROLLBACK")
+        assert result == "Transaction rolled back"
+
+        assert db.execute("SELECT * FROM users") == [[1, 'Alice']]
+
+    def test_transaction_rollback_update(self, db):
+        """Test that ROLLBACK discards an uncommitted UPDATE."""
+        db.execute("CREATE TABLE users (id INT, name TEXT)")
+        db.execute("INSERT INTO users VALUES (1, 'Alice')")
+
+        db.execute("BEGIN")
+        db.execute("UPDATE users SET name = 'Bob' WHERE id = 1")
+        db.execute("ROLLBACK")
+
+        assert db.execute("SELECT * FROM users") == [[1, 'Alice']]
+
+    def test_transaction_rollback_delete(self, db):
+        """Test that ROLLBACK discards an uncommitted DELETE."""
+        db.execute("CREATE TABLE users (id INT, name TEXT)")
+        db.execute("INSERT INTO users VALUES (1, 'Alice')")
+
+        db.execute("BEGIN")
+        db.execute("DELETE FROM users WHERE id = 1")
+        db.execute("ROLLBACK")
+
+        assert db.execute("SELECT * FROM users") == [[1, 'Alice']]
+
+    def test_transaction_rollback_drop_table(self, db):
+        """Test that ROLLBACK restores a dropped table."""
+        db.execute("CREATE TABLE users (id INT, name TEXT)")
+        db.execute("INSERT INTO users VALUES (1, 'Alice')")
+
+        db.execute("BEGIN")
+        db.execute("DROP TABLE users")
+        assert 'users' not in db.tables
+        db.execute("ROLLBACK")
+
+        assert 'users' in db.tables
+        assert db.execute("SELECT * FROM users") == [[1, 'Alice']]
+
+    def test_transaction_commit_drop_table(self, db):
+        """Test that COMMIT makes a dropped table's file go away."""
+        db.execute("CREATE TABLE users (id INT, name TEXT)")
+        assert db.storage.table_exists('users')
+
+        db.execute("BEGIN")
+        db.execute("DROP TABLE users")
+        # The file survives until the transaction commits
+        assert db.storage.table_exists('users')
+        db.execute("COMMIT")
+
+        assert 'users' not in db.tables
+        assert not db.storage.table_exists('users')
+
+    def test_transaction_commit_drop_then_recreate(self, temp_dir):
+        """Test that re-creating a dropped table survives COMMIT."""
+        db1 = Database(temp_dir)
+        db1.execute("CREATE TABLE users (id INT, name TEXT)")
+        db1.execute("INSERT INTO users VALUES (1, 'Alice')")
+
+        db1.execute("BEGIN")
+        db1.execute("DROP TABLE users")
+        db1.execute("CREATE TABLE users (id INT)")
+        db1.execute("INSERT INTO users VALUES (7)")
+        db1.execute("COMMIT")
+
+        assert db1.storage.table_exists('users')
+        db2 = Database(temp_dir)
+        assert db2.execute("SELECT * FROM users") == [[7]]
+
+    def test_transaction_rollback_drop_then_recreate(self, db):
+        """Test that ROLLBACK restores the original over a re-created table."""
+        db.execute("CREATE TABLE users (id INT, name TEXT)")
+        db.execute("INSERT INTO users VALUES (1, 'Alice')")
+
+        db.execute("BEGIN")
+        db.execute("DROP TABLE users")
+        db.execute("CREATE TABLE users (id INT)")
+        db.execute("INSERT INTO users VALUES (7)")
+        db.execute("ROLLBACK")
+
+        assert db.execute("SELECT * FROM users") == [[1, 'Alice']]
+
+    def test_nested_begin_raises(self, db):
+        """Test that BEGIN inside a transaction raises an error."""
+        db.execute("BEGIN")
+        with pytest.raises(ValueError, match="Transaction already in progress"):
+            db.execute("BEGIN")
+
+    def test_commit_without_transaction_raises(self, db):
+        """Test that COMMIT outside a transaction raises an error."""
+        with pytest.raises(ValueError, match="No transaction in progress"):
+            db.execute("COMMIT")
+
+    def test_rollback_without_transaction_raises(self, db):
+        """Test that ROLLBACK outside a transaction raises an error."""
+        with pytest.raises(ValueError, match="No transaction in progress"):
+            db.execute("ROLLBACK")
+
+    def test_context_manager_skips_flush_on_exception(self, temp_dir):
+        """Test that an exception inside the with block discards pending saves."""
+        db1 = Database(temp_dir)
+        db1.execute("CREATE TABLE users (id INT, name TEXT)")
+
+        with pytest.raises(RuntimeError):
+            with Database(temp_dir) as db2:
+                db2.execute("BEGIN")
+                db2.execute("INSERT INTO users VALUES (1, 'Alice')")
+                raise RuntimeError("boom")
+
+        db3 = Database(temp_dir)
+        assert db3.execute("SELECT * FROM users") == []
+
+    def test_context_manager_skips_flush_on_open_transaction(self, temp_dir):
+        """Test that leaving the with block mid-transaction doesn't persist."""
+        db1 = Database(temp_dir)
+        db1.execute("CREATE TABLE users (id INT, name TEXT)")
+
+        with Database(temp_dir) as db2:
+            db2.execute("BEGIN")
+            db2.execute("INSERT INTO users VALUES (1, 'Alice')")
+
+        db3 = Database(temp_dir)
+        assert db3.execute("SELECT * FROM users") == []
+
+    def test_close_during_transaction_keeps_rollback_working(self, temp_dir):
+        """Test that close() mid-transaction persists nothing and ROLLBACK still works."""
+        db1 = Database(temp_dir)
+        db1.execute("CREATE TABLE users (id INT, name TEXT)")
+
+        db1.execute("BEGIN")
+        db1.execute("INSERT INTO users VALUES (1, 'Alice')")
+        db1.close()
+        db1.execute("ROLLBACK")
+
+        assert db1.execute("SELECT * FROM users") == []
+        db2 = Database(temp_dir)
+        assert db2.execute("SELECT * FROM users") == []
+
     def test_persistence(self, temp_dir):
         """Test data persists across Database instances."""
         db1 = Database(temp_dir)
@@ -174,4 +174,28 @@ class TestSelectOperations:
         results = table.select(where={'text': ''})
 
         assert len(results) == 1
-        assert results[0] == [2, '']
\ No newline at end of file
+        assert results[0] == [2, '']
+
+    def test_select_iter_matches_select(self, sample_table):
+        """Test that select_iter yields the same rows as select"""
+        assert list(sample_table.select_iter()) == sample_table.select()
+        assert (list(sample_table.select_iter(columns=['name'], where={'active': True}))
+                == sample_table.select(columns=['name'], where={'active': True}))
+
+    def test_select_iter_is_lazy(self, sample_table):
+        """Test that select_iter yields one row at a time"""
+        rows = sample_table.select_iter()
+        assert next(rows) == [1, 'Alice', 30, True]
+        assert next(rows) == [2, 'Bob', 25, True]
+
+    def test_select_iter_yields_copies(self, sample_table):
+        """Test that mutating a yielded row doesn't affect the table"""
+        row = next(sample_table.select_iter())
+        row[1] = 'Mallory'
+
+        assert sample_table.rows[0] == [1, 'Alice', 30, True]
+
+    def test_select_iter_invalid_column(self, sample_table):
+        """Test select_iter with invalid column name raises error"""
+        with pytest.raises(ValueError, match="Column 'invalid' does not exist"):
+            next(sample_table.select_iter(columns=['invalid']))
\ No newline at end of file
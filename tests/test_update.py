@@ -1,19 +1,29 @@
+import copy
+
 import pytest
 from rdbms.table import Table
 
 
+@pytest.fixture(scope='module')
+def _base_table():
+    """Build the shared sample table once for the whole module"""
+    table = Table('users', ['id', 'name', 'age', 'active'], ['INT', 'TEXT', 'INT', 'BOOL'])
+    table.insert_many([
+        [1, 'Alice', 30, True],
+        [2, 'Bob', 25, True],
+        [3, 'Charlie', 35, False],
+        [4, 'Diana', 28, True],
+    ])
+    return table
+
+
 class TestUpdateOperations:
     """Test cases for UPDATE operations"""
 
     @pytest.fixture
-    def sample_table(self):
-        """Create a sample table with test data"""
-        table = Table('users', ['id', 'name', 'age', 'active'], ['INT', 'TEXT', 'INT', 'BOOL'])
-        table.insert([1, 'Alice', 30, True])
-        table.insert([2, 'Bob', 25, True])
-        table.insert([3, 'Charlie', 35, False])
-        table.insert([4, 'Diana', 28, True])
-        return table
+    def sample_table(self, _base_table):
+        """Hand each test its own deep copy of the prototype table"""
+        return copy.deepcopy(_base_table)
 
     def test_update_single_column_single_row(self, sample_table):
         """Test UPDATE single column for one row"""
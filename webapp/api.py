@@ -1,5 +1,7 @@
 """Simple FastAPI web application for the RDBMS."""
 
+import asyncio
+import functools
 import os
 import sys
 from pathlib import Path
@@ -9,12 +11,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional, Any, Dict
 
 from rdbms.repl import Database
 
-app = FastAPI(title="Simple RDBMS API")
+# orjson serializes responses several times faster than the default
+# json-based response class and writes bytes directly
+app = FastAPI(title="Simple RDBMS API", default_response_class=ORJSONResponse)
 
 # NEW: Add CORS middleware for browser access
 app.add_middleware(
@@ -27,7 +32,19 @@ app.add_middleware(
 
 # Use environment variable for data path
 DATA_PATH = os.getenv('DATA_PATH', 'data')
-db = Database(DATA_PATH)
+
+
+@functools.lru_cache(maxsize=1)
+def get_db() -> Database:
+    """Construct the shared Database once per process.
+
+    Usable as a FastAPI dependency; the cache guarantees repeated calls
+    (or a double import under --reload) never reload the data directory.
+    """
+    return Database(DATA_PATH)
+
+
+db = get_db()
 
 
 # Pydantic models for request/response
@@ -62,7 +79,7 @@ class QueryRequest(BaseModel):
 
 
 @app.get("/")
-def read_root():
+async def read_root():
     """Root endpoint."""
     return {
         "message": "Simple RDBMS API",
@@ -81,7 +98,7 @@ def read_root():
 
 # health check endpoint
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint for Docker."""
     return {
         "status": "healthy",
@@ -91,32 +108,30 @@ def health_check():
 
 
 @app.get("/tables")
-def list_tables():
+async def list_tables():
     """List all tables."""
     return {"tables": list(db.tables.keys())}
 
 
 @app.post("/tables")
-def create_table(table: TableCreate):
+async def create_table(table: TableCreate):
     """Create a new table."""
     try:
-        sql = f"CREATE TABLE {table.name} ("
-        col_defs = []
-
-        for col, col_type in zip(table.columns, table.types):
-            col_def = f"{col} {col_type}"
-
-            if table.primary_key and col == table.primary_key:
-                col_def += " PRIMARY KEY"
-
-            if table.unique_constraints and col in table.unique_constraints:
-                col_def += " UNIQUE"
-
-            col_defs.append(col_def)
-
-        sql += ", ".join(col_defs) + ")"
-
-        result = db.execute(sql)
+        # Set membership keeps the per-column UNIQUE check O(1), and the
+        # whole statement is assembled in one join instead of repeated
+        # string concatenation
+        uniques = set(table.unique_constraints or ())
+        col_defs = ", ".join(
+            f"{col} {col_type}"
+            f"{' PRIMARY KEY' if col == table.primary_key else ''}"
+            f"{' UNIQUE' if col in uniques else ''}"
+            for col, col_type in zip(table.columns, table.types)
+        )
+        sql = f"CREATE TABLE {table.name} ({col_defs})"
+
+        # The save at the end of CREATE TABLE fsyncs; keep it off the
+        # event loop
+        result = await asyncio.to_thread(db.execute, sql)
         return {"message": result, "table_name": table.name}
 
     except Exception as e:
@@ -124,131 +139,97 @@ def create_table(table: TableCreate):
 
 
 @app.delete("/tables/{table_name}")
-def drop_table(table_name: str):
+async def drop_table(table_name: str):
     """Drop a table."""
     try:
-        result = db.execute(f"DROP TABLE {table_name}")
+        result = await asyncio.to_thread(db.execute, f"DROP TABLE {table_name}")
         return {"message": result}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.post("/rows")
-def insert_row(row: RowInsert):
+async def insert_row(row: RowInsert):
     """Insert a row into a table."""
+    if row.table_name not in db.tables:
+        raise HTTPException(status_code=404, detail=f"Table '{row.table_name}' not found")
+
     try:
-        # Format values for SQL
-        formatted_values = []
-        for val in row.values:
-            if isinstance(val, str):
-                formatted_values.append(f"'{val}'")
-            elif isinstance(val, bool):
-                formatted_values.append('true' if val else 'false')
-            else:
-                formatted_values.append(str(val))
-
-        sql = f"INSERT INTO {row.table_name} VALUES ({', '.join(formatted_values)})"
-        result = db.execute(sql)
-        return {"message": result}
+        # The request already carries native Python values, so call the
+        # table directly instead of formatting them into SQL that the
+        # parser would just turn back into the same list
+        db.tables[row.table_name].insert(list(row.values))
+        # The save fsyncs the table file; run it in a worker thread so a
+        # slow disk never stalls the event loop
+        await asyncio.to_thread(db._save_table, row.table_name)
+        return {"message": "1 row inserted"}
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.post("/query")
-def query_table(query: QueryRequest):
+async def query_table(query: QueryRequest):
     """Query a table with optional filtering."""
+    if query.table_name not in db.tables:
+        raise HTTPException(status_code=404, detail=f"Table '{query.table_name}' not found")
+
     try:
-        # Build SELECT statement
-        columns = ", ".join(query.columns) if query.columns else "*"
-        sql = f"SELECT {columns} FROM {query.table_name}"
-
-        if query.where:
-            # Only support single WHERE condition for simplicity
-            col, val = list(query.where.items())[0]
-            if isinstance(val, str):
-                sql += f" WHERE {col} = '{val}'"
-            elif isinstance(val, bool):
-                sql += f" WHERE {col} = {'true' if val else 'false'}"
-            else:
-                sql += f" WHERE {col} = {val}"
-
-        result = db.execute(sql)
-
-        # Get column names for response
+        # The request's columns/where are already in the shape
+        # Table.select takes, so skip the SQL round-trip; this also
+        # lifts the old single-condition WHERE limitation. An empty
+        # columns list means "all columns", like the old SELECT *
+        # fallback, so it must not reach select as a real projection.
         table = db.tables[query.table_name]
-        if query.columns:
-            headers = query.columns
-        else:
-            headers = table.columns
+        columns = query.columns or None
+        result = table.select(columns=columns, where=query.where)
 
-        # Format as list of dicts
-        rows = []
-        for row in result:
-            rows.append(dict(zip(headers, row)))
+        headers = columns if columns else table.columns
 
-        return {"data": rows, "count": len(rows)}
+        # Tabular shape: headers once plus plain row lists, instead of
+        # repeating every column name in a dict per row
+        return {"headers": headers, "rows": result, "count": len(result)}
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.put("/rows")
-def update_rows(update: RowUpdate):
+async def update_rows(update: RowUpdate):
     """Update rows in a table."""
+    if update.table_name not in db.tables:
+        raise HTTPException(status_code=404, detail=f"Table '{update.table_name}' not found")
+
     try:
-        # Build SET clause
-        set_parts = []
-        for col, val in update.set_values.items():
-            if isinstance(val, str):
-                set_parts.append(f"{col} = '{val}'")
-            elif isinstance(val, bool):
-                set_parts.append(f"{col} = {'true' if val else 'false'}")
-            else:
-                set_parts.append(f"{col} = {val}")
-
-        sql = f"UPDATE {update.table_name} SET {', '.join(set_parts)}"
-
-        if update.where:
-            col, val = list(update.where.items())[0]
-            if isinstance(val, str):
-                sql += f" WHERE {col} = '{val}'"
-            elif isinstance(val, bool):
-                sql += f" WHERE {col} = {'true' if val else 'false'}"
-            else:
-                sql += f" WHERE {col} = {val}"
-
-        result = db.execute(sql)
-        return {"message": result}
+        # set_values and where are already the dicts Table.update takes;
+        # no SQL formatting and re-parsing, and multi-condition WHERE
+        # works where the old single-pair formatting did not
+        rows = db.tables[update.table_name].update(
+            set_values=update.set_values, where=update.where or None)
+        await asyncio.to_thread(db._save_table, update.table_name)
+        return {"message": f"{rows} row(s) updated"}
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.delete("/rows")
-def delete_rows(delete: RowDelete):
+async def delete_rows(delete: RowDelete):
     """Delete rows from a table."""
+    if delete.table_name not in db.tables:
+        raise HTTPException(status_code=404, detail=f"Table '{delete.table_name}' not found")
+
     try:
-        sql = f"DELETE FROM {delete.table_name}"
-
-        if delete.where:
-            col, val = list(delete.where.items())[0]
-            if isinstance(val, str):
-                sql += f" WHERE {col} = '{val}'"
-            elif isinstance(val, bool):
-                sql += f" WHERE {col} = {'true' if val else 'false'}"
-            else:
-                sql += f" WHERE {col} = {val}"
-
-        result = db.execute(sql)
-        return {"message": result}
+        rows = db.tables[delete.table_name].delete(where=delete.where or None)
+        await asyncio.to_thread(db._save_table, delete.table_name)
+        return {"message": f"{rows} row(s) deleted"}
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.get("/tables/{table_name}")
-def get_table_info(table_name: str):
+async def get_table_info(table_name: str):
     """Get table schema information."""
     if table_name not in db.tables:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")